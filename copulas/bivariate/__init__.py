@@ -23,35 +23,29 @@ COMPUTE_EMPIRICAL_STEPS = 50
 def _compute_empirical(X):
     """Compute empirical distribution.
 
+    The fraction of points with both coordinates below (or above) each step is obtained
+    by sorting the maximum (or minimum) of each pair once and searching the steps on it.
+
     Args:
         X(numpy.array): Shape (n,2); Datapoints to compute the empirical(frequentist) copula.
 
     Return:
-        tuple(list):
+        tuple(numpy.ndarray):
 
     """
-    z_left = []
-    z_right = []
-    L = []
-    R = []
-
     U, V = split_matrix(X)
     N = len(U)
     base = np.linspace(EPSILON, 1.0 - EPSILON, COMPUTE_EMPIRICAL_STEPS)
     # See https://github.com/sdv-dev/Copulas/issues/45
 
-    for k in range(COMPUTE_EMPIRICAL_STEPS):
-        left = sum(np.logical_and(U <= base[k], V <= base[k])) / N
-        right = sum(np.logical_and(U >= base[k], V >= base[k])) / N
+    left = np.searchsorted(np.sort(np.maximum(U, V)), base, side='right') / N
+    right = (N - np.searchsorted(np.sort(np.minimum(U, V)), base, side='left')) / N
 
-        if left > 0:
+    z_left = base[left > 0]
+    L = left[left > 0] / z_left ** 2
 
-            z_left.append(base[k])
-            L.append(left / base[k] ** 2)
-
-        if right > 0:
-            z_right.append(base[k])
-            R.append(right / (1 - z_right[k]) ** 2)
+    z_right = base[right > 0]
+    R = right[right > 0] / (1 - z_right) ** 2
 
     return z_left, L, z_right, R
 
@@ -83,19 +77,18 @@ def _compute_candidates(copulas, left_tail, right_tail):
         z_right(list):
 
     Returns:
-        tuple[list]: Arrays of left and right dependencies for the empirical copula.
-
+        tuple[numpy.ndarray]: Arrays of left and right dependencies for each candidate copula,
+        of shapes (n_candidates, len(left_tail)) and (n_candidates, len(right_tail)).
 
     """
-    left = []
-    right = []
-
     X_left = np.column_stack((left_tail, left_tail))
     X_right = np.column_stack((right_tail, right_tail))
 
-    for copula in copulas:
-        left.append(copula.cumulative_distribution(X_left) / np.power(left_tail, 2))
-        right.append(_compute_tail(copula.cumulative_distribution(X_right), right_tail))
+    left_cdfs = np.array([copula.cumulative_distribution(X_left) for copula in copulas])
+    right_cdfs = np.array([copula.cumulative_distribution(X_right) for copula in copulas])
+
+    left = left_cdfs / np.power(left_tail, 2)
+    right = _compute_tail(right_cdfs, right_tail)
 
     return left, right
 
@@ -152,16 +145,12 @@ def select_copula(X):
         copula_candidates, left_tail, right_tail)
 
     empirical_aut = np.concatenate((empirical_left_aut, empirical_right_aut))
-    candidate_auts = [
-        np.concatenate((left, right)) for left, right in zip(
-            candidate_left_auts, candidate_right_auts
-        )
-    ]
-
-    # compute L2 distance from empirical distribution
-    diff_left = [np.sum((empirical_left_aut - left) ** 2) for left in candidate_left_auts]
-    diff_right = [np.sum((empirical_right_aut - right) ** 2) for right in candidate_right_auts]
-    diff_both = [np.sum((empirical_aut - candidate) ** 2) for candidate in candidate_auts]
+    candidate_auts = np.concatenate((candidate_left_auts, candidate_right_auts), axis=1)
+
+    # compute L2 distance from empirical distribution for all the candidates at once
+    diff_left = np.sum((empirical_left_aut - candidate_left_auts) ** 2, axis=1)
+    diff_right = np.sum((empirical_right_aut - candidate_right_auts) ** 2, axis=1)
+    diff_both = np.sum((empirical_aut - candidate_auts) ** 2, axis=1)
 
     # calcule ranks
     score_left = pd.Series(diff_left).rank(ascending=False)
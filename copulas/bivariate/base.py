@@ -1,12 +1,12 @@
 """This module contains a base class for bivariate copulas."""
 
+import inspect
 import json
 import warnings
 from enum import Enum
+from functools import lru_cache
 
 import numpy as np
-from scipy import stats
-from scipy.optimize import brentq
 
 from copulas import EPSILON, NotFittedError, random_state
 from copulas.bivariate.utils import split_matrix
@@ -21,6 +21,48 @@ class CopulaTypes(Enum):
     INDEPENDENCE = 3
 
 
+KENDALLTAU_KWARGS = {
+    'variant': 'b',
+    'method': 'asymptotic',
+}
+
+
+@lru_cache(maxsize=None)
+def _kendalltau_kwargs():
+    """Return the :data:`KENDALLTAU_KWARGS` supported by the installed `scipy.stats.kendalltau`."""
+    from scipy import stats
+
+    parameters = inspect.signature(stats.kendalltau).parameters
+    return {
+        name: value
+        for name, value in KENDALLTAU_KWARGS.items()
+        if name in parameters
+    }
+
+
+def _fast_kendall_tau(U, V):
+    r"""Compute Kendall's tau-b between two vectors.
+
+    SciPy computes the statistic in :math:`O(n \log n)` by counting the discordant pairs
+    with Knight's merge sort algorithm. The arguments in :data:`KENDALLTAU_KWARGS` are
+    pinned whenever the installed SciPy version supports them: the ``b`` variant and the
+    asymptotic p-value, which skips the exact p-value computation SciPy otherwise runs
+    on small samples without ties.
+
+    Args:
+        U(np.ndarray): Array of datapoints with shape (n,).
+        V(np.ndarray): Array of datapoints with shape (n,).
+
+    Returns:
+        float: Kendall's tau-b, ``nan`` if it can not be computed.
+
+    """
+    from scipy import stats
+
+    result = stats.kendalltau(U, V, **_kendalltau_kwargs())
+    return getattr(result, 'statistic', result[0])
+
+
 class Bivariate(object):
     """Base class for bivariate copulas.
 
@@ -40,9 +82,10 @@ class Bivariate(object):
 
     Attributes:
         copula_type(CopulaTypes): Family of the copula a subclass belongs to.
-        _subclasses(list[type]): List of declared subclasses.
+        _type_to_subclass(dict[CopulaTypes, type]): Declared subclasses by their copula type,
+            populated as they are defined. The first subclass declaring a type is kept.
         theta_interval(list[float]): Interval of valid thetas for the given copula family.
-        invalid_thetas(list[float]): Values that, even though they belong to
+        invalid_thetas(frozenset[float]): Values that, even though they belong to
             :attr:`theta_interval`, shouldn't be considered valid.
         tau (float): Kendall's tau for the data given at :meth:`fit`.
         theta(float): Parameter for the copula.
@@ -50,39 +93,35 @@ class Bivariate(object):
     """
 
     copula_type = None
-    _subclasses = []
+    _type_to_subclass = {}
     theta_interval = []
-    invalid_thetas = []
+    invalid_thetas = frozenset()
     theta = None
     tau = None
 
-    @classmethod
-    def _get_subclasses(cls):
-        """Find recursively subclasses for the current class object.
-
-        Returns:
-            list[Bivariate]: List of subclass objects.
+    def __init_subclass__(cls, **kwargs):
+        """Register the new subclass under the copula type it declares.
 
+        The first subclass declaring a :attr:`copula_type` keeps it: later subclasses that
+        declare the same type again, or inherit it, are not registered, so the family keeps
+        being dispatched to the class that defined it first.
         """
-        subclasses = []
-        for subclass in cls.__subclasses__():
-            subclasses.append(subclass)
-            subclasses.extend(subclass._get_subclasses())
-
-        return subclasses
+        super().__init_subclass__(**kwargs)
+        if 'copula_type' in cls.__dict__ and cls.copula_type is not None:
+            Bivariate._type_to_subclass.setdefault(cls.copula_type, cls)
 
     @classmethod
     def subclasses(cls):
-        """Return a list of subclasses for the current class object.
+        """Return a list of the registered subclasses for the current class object.
 
         Returns:
             list[Bivariate]: Subclasses for given class.
 
         """
-        if not cls._subclasses:
-            cls._subclasses = cls._get_subclasses()
-
-        return cls._subclasses
+        return [
+            subclass for subclass in Bivariate._type_to_subclass.values()
+            if issubclass(subclass, cls) and subclass is not cls
+        ]
 
     def __new__(cls, *args, **kwargs):
         """Create and return a new object.
@@ -95,14 +134,20 @@ class Bivariate(object):
             return super(Bivariate, cls).__new__(cls)
 
         if not isinstance(copula_type, CopulaTypes):
-            if (isinstance(copula_type, str) and copula_type.upper() in CopulaTypes.__members__):
-                copula_type = CopulaTypes[copula_type.upper()]
-            else:
+            member = None
+            if isinstance(copula_type, str):
+                member = CopulaTypes.__members__.get(copula_type.upper())
+
+            if member is None:
                 raise ValueError('Invalid copula type {}'.format(copula_type))
 
-        for subclass in cls.subclasses():
-            if subclass.copula_type is copula_type:
-                return super(Bivariate, cls).__new__(subclass)
+            copula_type = member
+
+        subclass = Bivariate._type_to_subclass.get(copula_type)
+        if subclass is None:
+            raise ValueError('Copula type {} is not registered'.format(copula_type.name))
+
+        return super(Bivariate, cls).__new__(subclass)
 
     def __init__(self, copula_type=None, random_seed=None):
         """Initialize Bivariate object.
@@ -176,7 +221,7 @@ class Bivariate(object):
         U, V = split_matrix(X)
         self.check_marginal(U)
         self.check_marginal(V)
-        self.tau = stats.kendalltau(U, V)[0]
+        self.tau = _fast_kendall_tau(U, V)
         if np.isnan(self.tau):
             if len(np.unique(U)) == 1 or len(np.unique(V)) == 1:
                 raise ValueError("Constant column.")
@@ -284,10 +329,19 @@ class Bivariate(object):
     def percent_point(self, y, V):
         """Compute the inverse of conditional cumulative distribution :math:`C(u|v)^{-1}`.
 
+        This method is called once with the whole batch of values, so subclasses
+        should override it with a vectorized implementation, ideally a closed-form
+        inverse, whenever possible. The base class solves each value with `brentq`.
+
         Args:
             y: `np.ndarray` value of :math:`C(u|v)`.
             v: `np.ndarray` given value of v.
+
+        Returns:
+            np.ndarray: Values of u, with the same shape as y.
         """
+        from scipy.optimize import brentq
+
         self.check_fit()
         result = []
         for _y, _v in zip(y, V):
@@ -354,11 +408,12 @@ class Bivariate(object):
         if self.tau > 1 or self.tau < -1:
             raise ValueError("The range for correlation measure is [-1,1].")
 
-        v = np.random.uniform(0, 1, n_samples)
-        c = np.random.uniform(0, 1, n_samples)
+        # Both c and v are drawn into a single buffer, and u overwrites c in place.
+        samples = np.random.uniform(0, 1, (n_samples, 2))
 
-        u = self.percent_point(c, v)
-        return np.column_stack((u, v))
+        # percent_point is evaluated once over the whole batch of samples.
+        samples[:, 0] = self.percent_point(samples[:, 0], samples[:, 1])
+        return samples
 
     def compute_theta(self):
         """Compute theta parameter using Kendall's tau."""
@@ -414,7 +469,7 @@ class Bivariate(object):
         """
         content = self.to_dict()
         with open(filename, 'w') as f:
-            json.dump(content, f)
+            json.dump(content, f, separators=(',', ':'))
 
     @classmethod
     def load(cls, copula_path):
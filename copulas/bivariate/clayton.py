@@ -9,7 +9,7 @@ class Clayton(Bivariate):
 
     copula_type = CopulaTypes.CLAYTON
     theta_interval = [0, float('inf')]
-    invalid_thetas = []
+    invalid_thetas = frozenset()
 
     def generator(self, t):
         r"""Compute the generator function for Clayton copula family.
@@ -50,10 +50,18 @@ class Clayton(Bivariate):
 
         U, V = split_matrix(X)
 
-        a = (self.theta + 1) * np.power(np.multiply(U, V), -(self.theta + 1))
-        b = np.power(U, -self.theta) + np.power(V, -self.theta) - 1
-        c = -(2 * self.theta + 1) / self.theta
-        return a * np.power(b, c)
+        # Intermediate results are updated in place to avoid allocating temporary arrays.
+        a = np.multiply(U, V)
+        np.power(a, -(self.theta + 1), out=a)
+        a *= self.theta + 1
+
+        b = np.power(U, -self.theta)
+        b += np.power(V, -self.theta)
+        b -= 1
+        np.power(b, -(2 * self.theta + 1) / self.theta, out=b)
+
+        a *= b
+        return a
 
     def cumulative_distribution(self, X):
         """Compute the cumulative distribution function for the clayton copula.
@@ -78,16 +86,14 @@ class Clayton(Bivariate):
             return np.zeros(V.shape[0])
 
         else:
-            cdfs = [
-                np.power(
-                    np.power(U[i], -self.theta) + np.power(V[i], -self.theta) - 1,
-                    -1.0 / self.theta
-                )
-                if (U[i] > 0 and V[i] > 0) else 0
-                for i in range(len(U))
-            ]
+            cdfs = np.zeros(len(U))
+            positive = (U > 0) & (V > 0)
+            cdfs[positive] = np.power(
+                np.power(U[positive], -self.theta) + np.power(V[positive], -self.theta) - 1,
+                -1.0 / self.theta
+            )
 
-            return np.array(cdfs)
+            return cdfs
 
     def percent_point(self, y, V):
         """Compute the inverse of conditional cumulative distribution :math:`C(u|v)^{-1}`.
@@ -115,10 +121,11 @@ class Clayton(Bivariate):
     def partial_derivative(self, X):
         r"""Compute partial derivative of cumulative distribution.
 
-        The partial derivative of the copula(CDF) is the conditional CDF.
+        The partial derivative of the copula(CDF) is the conditional CDF, which has a
+        closed form for the Clayton family:
 
-        .. math:: F(v|u) = \frac{\partial C(u,v)}{\partial u} =
-            u^{- \theta - 1}(u^{-\theta} + v^{-\theta} - 1)^{-\frac{\theta+1}{\theta}}
+        .. math:: F(u|v) = \frac{\partial C(u,v)}{\partial v} =
+            v^{- \theta - 1}(u^{-\theta} + v^{-\theta} - 1)^{-\frac{\theta+1}{\theta}}
 
         Args:
             X (np.ndarray)
@@ -132,17 +139,42 @@ class Clayton(Bivariate):
 
         U, V = split_matrix(X)
 
-        A = np.power(V, -self.theta - 1)
+        V_pow = np.power(V, -self.theta)
+        A = V_pow / V
 
         # If theta tends to inf, A tends to inf
         # And the next partial_derivative tends to 0
         if (A == np.inf).any():
             return np.zeros(len(V))
 
-        B = np.power(V, -self.theta) + np.power(U, -self.theta) - 1
+        B = V_pow + np.power(U, -self.theta) - 1
         h = np.power(B, (-1 - self.theta) / self.theta)
         return np.multiply(A, h)
 
+    @classmethod
+    def theta_from_tau(cls, tau):
+        r"""Compute the values of theta that correspond to the given values of Kendall's tau.
+
+        .. math:: θ = 2τ/(1-τ)
+
+        On the corner case of :math:`τ = 1`, theta is infinite.
+
+        Args:
+            tau (Union[float, numpy.ndarray]): Values of Kendall's tau.
+
+        Returns:
+            Union[float, numpy.ndarray]: Values of theta, with the same shape as `tau`.
+
+        """
+        tau = np.asarray(tau, dtype=float)
+        with np.errstate(divide='ignore'):
+            theta = np.where(tau == 1, np.inf, 2 * tau / (1 - tau))
+
+        if theta.ndim == 0:
+            return theta.item()
+
+        return theta
+
     def compute_theta(self):
         r"""Compute theta parameter using Kendall's tau.
 
@@ -153,7 +185,4 @@ class Clayton(Bivariate):
 
         On the corner case of :math:`τ = 1`, return infinite.
         """
-        if self.tau == 1:
-            return np.inf
-
-        return 2 * self.tau / (1 - self.tau)
+        return self.theta_from_tau(self.tau)
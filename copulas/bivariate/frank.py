@@ -1,8 +1,6 @@
 import sys
 
 import numpy as np
-import scipy.integrate as integrate
-from scipy.optimize import least_squares
 
 from copulas import EPSILON
 from copulas.bivariate.base import Bivariate, CopulaTypes
@@ -17,7 +15,7 @@ class Frank(Bivariate):
 
     copula_type = CopulaTypes.FRANK
     theta_interval = [-float('inf'), float('inf')]
-    invalid_thetas = [0]
+    invalid_thetas = frozenset({0})
 
     def generator(self, t):
         """Return the generator function."""
@@ -158,11 +156,15 @@ class Frank(Bivariate):
         .. math:: D_1(x) = \frac{1}{x}\int_0^x\frac{t}{e^t -1} \mathrm{d}t.
 
         """
+        from scipy.optimize import least_squares
+
         result = least_squares(self._tau_to_theta, 1, bounds=(MIN_FLOAT_LOG, MAX_FLOAT_LOG))
         return result.x[0]
 
     def _tau_to_theta(self, alpha):
         """Relationship between tau and theta as a solvable equation."""
+        from scipy import integrate
+
         def debye(t):
             return t / (np.exp(t) - 1)
 
@@ -10,7 +10,7 @@ class Gumbel(Bivariate):
 
     copula_type = CopulaTypes.GUMBEL
     theta_interval = [1, float('inf')]
-    invalid_thetas = []
+    invalid_thetas = frozenset()
 
     def generator(self, t):
         """Return the generator function."""
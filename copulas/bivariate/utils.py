@@ -4,6 +4,9 @@ import numpy as np
 def split_matrix(X):
     """Split an (n,2) numpy.array into two vectors.
 
+    The input is converted to a `float64` array only when needed, and the returned
+    vectors are views on its columns, so no data is copied for `float64` inputs.
+
     Args:
         X(numpy.array): Matrix of shape (n,2)
 
@@ -12,6 +15,7 @@ def split_matrix(X):
 
     """
     if len(X):
+        X = np.asarray(X, dtype=np.float64)
         return X[:, 0], X[:, 1]
 
     return np.array([]), np.array([])
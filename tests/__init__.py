@@ -30,16 +30,47 @@ def compare_nested_dicts(first, second, epsilon=10E-6):
 
 
 def compare_values_epsilon(first, second, epsilon=10E-6,):
-    if pd.isnull(first) and pd.isnull(second):
+    both_null = np.logical_and(pd.isnull(first), pd.isnull(second))
+    if np.all(both_null):
         return True
 
-    return abs(first - second) < epsilon
+    return np.logical_or(both_null, np.abs(np.subtract(first, second)) < epsilon)
+
+
+def _as_float_vectors(first, second):
+    """Return both values as flat `float64` arrays, or None if `first` is not one already.
+
+    Only flat `float64` arrays are compared in a single vectorized call, since each of their
+    elements is a `float` that the element-wise walk would compare with
+    :func:`compare_values_epsilon` anyway.
+    """
+    if not (isinstance(first, np.ndarray) and first.ndim == 1 and first.dtype == np.float64):
+        return None
+
+    try:
+        second = np.asarray(second, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+
+    if second.shape != first.shape:
+        return None
+
+    return first, second
 
 
 def compare_nested_iterables(first, second, epsilon=10E-6):
 
     assert len(first) == len(second), "Iterables should have the same length to be compared."
 
+    vectors = _as_float_vectors(first, second)
+    if vectors is not None:
+        matches = compare_values_epsilon(*vectors, epsilon)
+        if not np.all(matches):
+            index = np.argmin(matches)
+            raise AssertionError(COMPARE_VALUES_ERROR.format(index, first[index], second[index]))
+
+        return
+
     for index, (_first, _second) in enumerate(zip(first, second)):
 
         message = COMPARE_VALUES_ERROR.format(index, _first, _second)
@@ -82,15 +113,11 @@ def copula_zero_if_arg_zero(copula, dimensions=2, steps=10, tolerance=1E-05):
     """
     # Setup
     step_values = np.linspace(0.0, 1.0, steps + 1)[1:]
-    values = []
-
-    for index in range(dimensions):
-        for value in step_values:
-            result = np.full(dimensions, value)
-            result[index] = 0
-            values.append(result.tolist())
+    rows = np.arange(dimensions * steps)
+    columns = np.repeat(np.arange(dimensions), steps)
 
-    probabilities = np.array(values)
+    probabilities = np.repeat(np.tile(step_values, dimensions)[:, None], dimensions, axis=1)
+    probabilities[rows, columns] = 0
     expected_result = np.zeros(dimensions * steps)
 
     # Run
@@ -119,16 +146,12 @@ def copula_single_arg_not_one(copula, dimensions=2, steps=10, tolerance=1E-05):
     """
     # Setup
     step_values = np.linspace(0.0, 1.0, steps + 1)[1: -1]
-    values = []
-
-    for index in range(dimensions):
-        for value in step_values:
-            result = np.ones(dimensions)
-            result[index] = value
-            values.append(result.tolist())
-
-    probabilities = np.array(values)
     expected_result = np.tile(step_values, dimensions)
+    rows = np.arange(len(expected_result))
+    columns = np.repeat(np.arange(dimensions), len(step_values))
+
+    probabilities = np.ones((len(expected_result), dimensions))
+    probabilities[rows, columns] = expected_result
 
     # Run
     result = copula.cdf(probabilities)
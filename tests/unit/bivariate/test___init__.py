@@ -1,7 +1,7 @@
 import numpy as np
 from scipy import stats
 
-from copulas.bivariate import select_copula
+from copulas.bivariate import _compute_empirical, select_copula
 from copulas.bivariate.frank import Frank
 
 
@@ -21,3 +21,27 @@ def test_select_copula_negative_tau():
 
     # Check
     assert isinstance(copula, Frank)
+
+
+def test__compute_empirical():
+    """_compute_empirical counts the points with both values below and above each step."""
+    # Setup
+    X = np.array([
+        [0.1, 0.2],
+        [0.3, 0.25],
+        [0.5, 0.9],
+        [0.7, 0.6],
+        [0.95, 0.8]
+    ])
+    U, V = X[:, 0], X[:, 1]
+
+    # Run
+    z_left, L, z_right, R = _compute_empirical(X)
+
+    # Check
+    left = np.array([np.mean((U <= z) & (V <= z)) for z in z_left])
+    right = np.array([np.mean((U >= z) & (V >= z)) for z in z_right])
+    assert (left > 0).all() and (right > 0).all()
+    assert np.allclose(L, left / z_left ** 2)
+    assert np.allclose(R, right / (1 - z_right) ** 2)
+    assert z_left[0] >= 0.2 and z_right[-1] <= 0.8
@@ -2,10 +2,28 @@ from unittest import TestCase, mock
 
 import numpy as np
 
-from copulas.bivariate.base import Bivariate, CopulaTypes
+from copulas.bivariate.base import Bivariate, CopulaTypes, _fast_kendall_tau
+from copulas.bivariate.clayton import Clayton
 from tests import compare_nested_dicts
 
 
+def test__fast_kendall_tau():
+    """_fast_kendall_tau matches the tau-b computed from all the pairs."""
+    # Setup
+    U = np.array([0.1, 0.4, 0.4, 0.3, 0.9, 0.7, 0.2])
+    V = np.array([0.2, 0.5, 0.1, 0.1, 0.8, 0.9, 0.3])
+
+    du = np.sign(U[:, None] - U[None, :])
+    dv = np.sign(V[:, None] - V[None, :])
+    expected_result = (du * dv).sum() / np.sqrt(np.abs(du).sum() * np.abs(dv).sum())
+
+    # Run
+    result = _fast_kendall_tau(U, V)
+
+    # Check
+    assert np.isclose(result, expected_result)
+
+
 class TestBivariate(TestCase):
 
     def setUp(self):
@@ -16,6 +34,48 @@ class TestBivariate(TestCase):
             [0.8, 0.6],
         ])
 
+    def test___new__copula_type_str(self):
+        """If copula_type is a string, the subclass is looked up case insensitively."""
+        # Run
+        instance = Bivariate(copula_type='gUmBeL')
+
+        # Check
+        assert instance.__class__.__name__ == 'Gumbel'
+        assert instance.copula_type == CopulaTypes.GUMBEL
+
+    def test___new__invalid_copula_type(self):
+        """If copula_type is not a valid family, a ValueError is raised."""
+        with self.assertRaises(ValueError):
+            Bivariate(copula_type='not_a_copula')
+
+    @mock.patch.object(Bivariate, '_type_to_subclass', {})
+    def test___new__copula_type_not_registered(self):
+        """If the class of a valid copula type is not registered, a ValueError is raised."""
+        with self.assertRaises(ValueError):
+            Bivariate(copula_type=CopulaTypes.CLAYTON)
+
+    @mock.patch.dict(Bivariate._type_to_subclass)
+    def test___init_subclass__(self):
+        """Subclasses are registered under the copula type they declare, first one wins."""
+        # Setup
+        clayton = Bivariate._type_to_subclass[CopulaTypes.CLAYTON]
+        Bivariate._type_to_subclass.pop(CopulaTypes.INDEPENDENCE, None)
+
+        # Run
+        class InheritedClayton(clayton):
+            pass
+
+        class RedeclaredClayton(Bivariate):
+            copula_type = CopulaTypes.CLAYTON
+
+        class CustomIndependence(Bivariate):
+            copula_type = CopulaTypes.INDEPENDENCE
+
+        # Check
+        assert Bivariate._type_to_subclass[CopulaTypes.CLAYTON] is clayton
+        assert Bivariate._type_to_subclass[CopulaTypes.INDEPENDENCE] is CustomIndependence
+        assert isinstance(Bivariate(copula_type='independence'), CustomIndependence)
+
     def test___init__random_seed(self):
         """If random_seed is passed as argument, will be set as attribute."""
         # Setup
@@ -82,6 +142,7 @@ class TestBivariate(TestCase):
         # Check
         assert open_mock.called_once_with('test.json', 'w')
         assert json_mock.called
+        assert json_mock.call_args[1] == {'separators': (',', ':')}
         compare_nested_dicts(json_mock.call_args[0][0], expected_content)
 
     @mock.patch('builtins.open')
@@ -104,6 +165,40 @@ class TestBivariate(TestCase):
         instance.tau == -0.33333333333333337
         instance.theta == -3.305771759329249
 
+    def test_from_dict_subclass(self):
+        """From_dict called on a subclass returns an instance of that subclass."""
+        # Setup
+        parameters = {
+            'copula_type': 'CLAYTON',
+            'tau': 0.5,
+            'theta': 2.0
+        }
+
+        # Run
+        instance = Clayton.from_dict(parameters)
+
+        # Check
+        assert isinstance(instance, Clayton)
+        assert instance.theta == 2.0
+
+    @mock.patch('builtins.open')
+    @mock.patch('copulas.bivariate.base.json.load')
+    def test_load_from_file_subclass(self, json_mock, open_mock):
+        """Load called on a subclass returns an instance of that subclass."""
+        # Setup
+        json_mock.return_value = {
+            'copula_type': 'CLAYTON',
+            'tau': 0.5,
+            'theta': 2.0
+        }
+
+        # Run
+        instance = Clayton.load('somefile.json')
+
+        # Check
+        assert isinstance(instance, Clayton)
+        assert instance.theta == 2.0
+
     @mock.patch('copulas.bivariate.clayton.Clayton.partial_derivative')
     def test_partial_derivative_scalar(self, derivative_mock):
         """partial_derivative_scalar calls partial_derivative with its arguments in an array."""
@@ -120,3 +215,18 @@ class TestBivariate(TestCase):
         expected_args = ((np.array([[0.5, 0.1]]), 0), {})
         assert len(expected_args) == len(derivative_mock.call_args)
         assert (derivative_mock.call_args[0][0] == expected_args[0][0]).all()
+
+    def test_partial_derivative_scalar_fresh_result(self):
+        """Each call to partial_derivative_scalar returns a new array."""
+        # Setup
+        instance = Bivariate(copula_type=CopulaTypes.GUMBEL)
+        instance.tau = 0.0
+        instance.theta = 1
+
+        # Run
+        first = instance.partial_derivative_scalar(np.array([0.1, 0.2]), np.array([0.3, 0.4]))
+        first_copy = first.copy()
+        instance.partial_derivative_scalar(np.array([0.5, 0.6]), np.array([0.7, 0.8]))
+
+        # Check
+        np.testing.assert_array_equal(first, first_copy)
@@ -82,16 +82,30 @@ class TestClayton(TestCase):
 
         assert np.isclose(U, U_inferred).all()
 
+    def test_theta_from_tau(self):
+        """theta_from_tau computes theta for every given tau, and infinite for tau = 1."""
+        # Setup
+        tau_values = np.array([0.0, 0.5, 0.8, 1.0])
+        expected_result = np.array([0.0, 2.0, 8.0, np.inf])
+
+        # Run
+        result = Clayton.theta_from_tau(tau_values)
+
+        # Check
+        assert isinstance(result, np.ndarray)
+        assert np.isclose(result, expected_result).all()
+        assert Clayton.theta_from_tau(0.5) == 2.0
+
     def test_cdf_zero_if_single_arg_is_zero(self):
         """Test of the analytical properties of copulas on a range of values of theta."""
         # Setup
         instance = Clayton()
         tau_values = np.linspace(0.0, 1.0, 20)[1: -1]
+        theta_values = Clayton.theta_from_tau(tau_values)
 
         # Run/Check
-        for tau in tau_values:
-            instance.tau = tau
-            instance.theta = instance.compute_theta()
+        for theta in theta_values:
+            instance.theta = theta
             copula_zero_if_arg_zero(instance)
 
     def test_cdf_value_if_all_other_arg_are_one(self):
@@ -99,9 +113,9 @@ class TestClayton(TestCase):
         # Setup
         instance = Clayton()
         tau_values = np.linspace(0.0, 1.0, 20)[1: -1]
+        theta_values = Clayton.theta_from_tau(tau_values)
 
         # Run/Check
-        for tau in tau_values:
-            instance.tau = tau
-            instance.theta = instance.compute_theta()
+        for theta in theta_values:
+            instance.theta = theta
             copula_single_arg_not_one(instance)
@@ -66,7 +66,8 @@ class TestFrank(TestCase):
         instance.tau = 0.5
         instance.theta = instance.compute_theta()
 
-        uniform_mock.return_value = np.array([0.1, 0.2, 0.4, 0.6, 0.8])
+        uniform_values = np.array([0.1, 0.2, 0.4, 0.6, 0.8])
+        uniform_mock.return_value = np.column_stack((uniform_values, uniform_values))
 
         expected_result = np.array([
             [0.0312640840463779, 0.1],
@@ -77,8 +78,7 @@ class TestFrank(TestCase):
         ])
 
         expected_uniform_call_args_list = [
-            ((0, 1, 5), {}),
-            ((0, 1, 5), {})
+            ((0, 1, (5, 2)), {})
         ]
 
         # Run